@@ -90,7 +90,11 @@ class ESConfig(AlgorithmConfig):
         # self.return_proc_mode = "centered_rank"  # only supported return_proc_mode
         self.stepsize = 0.01
         self.noise_size = 250000000
+        self.lazy_noise_table = False
         self.report_length = 10
+        self.update_backend = "numpy"
+        self.parallel_antithetic_rollouts = False
+        self.pipeline_rollouts = False
 
         # Override some of AlgorithmConfig's default values with ES-specific values.
         self.train_batch_size = 10000
@@ -118,7 +122,11 @@ class ESConfig(AlgorithmConfig):
         # return_proc_mode: Optional[int] = None,
         stepsize: Optional[float] = None,
         noise_size: Optional[int] = None,
+        lazy_noise_table: Optional[bool] = None,
         report_length: Optional[int] = None,
+        update_backend: Optional[str] = None,
+        parallel_antithetic_rollouts: Optional[bool] = None,
+        pipeline_rollouts: Optional[bool] = None,
         **kwargs,
     ) -> "ESConfig":
         """Sets the training related configuration.
@@ -135,7 +143,33 @@ class ESConfig(AlgorithmConfig):
             stepsize: SGD step-size used for the Adam optimizer.
             noise_size: Number of rows in the noise table (shared across workers).
                 Each row contains a gaussian noise value for each model parameter.
+            lazy_noise_table: Whether to regenerate noise slices on demand from a
+                seeded counter-based PRNG instead of materializing (and sharing)
+                a `noise_size` float16 table through the object store. Saves
+                the table's memory at the cost of re-drawing the noise for each
+                slice that is used (also on the driver, when computing the
+                gradient). If True, `noise_size` is ignored.
             report_length: How many of the last rewards we average over.
+            update_backend: Which library to compute the gradient and the Adam
+                update on the driver with. One of "numpy" or "jax". With "jax",
+                the ranking weights, the (batched) weighted noise sum and the
+                Adam step are computed by separate jit-compiled functions on
+                the default JAX device (e.g. a GPU). The N ranking weights are
+                fetched back to the host to slice them into the noise batches.
+                Rollouts are still done by the workers' tf|torch policies.
+            parallel_antithetic_rollouts: Whether to pair each worker with a
+                sibling actor, which does the negatively perturbed rollout of
+                each antithetic pair, while the worker does the positively
+                perturbed one. Halves the latency of each pair, but creates
+                2 x `num_workers` actors.
+            pipeline_rollouts: Whether to keep all workers busy while the
+                driver computes the gradient. Once enough episodes/timesteps
+                have been collected, the still busy workers are not waited for
+                and the idle ones (after syncing their filters) are right away
+                re-dispatched with the current (soon one update old) weights.
+                All these results are used in the next iteration, which
+                introduces a small off-policy bias. Each iteration, the filters
+                are only synced with these idle workers (and their siblings).
 
         Returns:
             This updated AlgorithmConfig object.
@@ -161,32 +195,118 @@ class ESConfig(AlgorithmConfig):
             self.stepsize = stepsize
         if noise_size is not None:
             self.noise_size = noise_size
+        if lazy_noise_table is not None:
+            self.lazy_noise_table = lazy_noise_table
         if report_length is not None:
             self.report_length = report_length
+        if update_backend is not None:
+            self.update_backend = update_backend
+        if parallel_antithetic_rollouts is not None:
+            self.parallel_antithetic_rollouts = parallel_antithetic_rollouts
+        if pipeline_rollouts is not None:
+            self.pipeline_rollouts = pipeline_rollouts
 
         return self
 
 
+NOISE_SEED = 123
+
+
 @ray.remote
 def create_shared_noise(count):
-    """Create a large array of noise to be shared by all workers."""
-    seed = 123
-    noise = np.random.RandomState(seed).randn(count).astype(np.float32)
+    """Create a large array of noise to be shared by all workers.
+
+    The noise is stored as float16 (half the memory and bandwidth of float32),
+    which is plenty of precision for parameter perturbations. Consumers upcast
+    the slices they use to float32.
+    """
+    noise = np.random.RandomState(NOISE_SEED).randn(count).astype(np.float16)
     return noise
 
 
 class SharedNoiseTable:
     def __init__(self, noise):
-        self.noise = noise
-        assert self.noise.dtype == np.float32
+        # The noise array or its ObjectRef (only resolved on first access).
+        self._noise = noise
+        if not isinstance(noise, ray.ObjectRef):
+            self._set_noise(noise)
+
+    @property
+    def noise(self):
+        if isinstance(self._noise, ray.ObjectRef):
+            # Zero-copy: The array is a view into the object store's shared
+            # memory (one copy per node, no matter how many readers).
+            self._set_noise(ray.get(self._noise))
+        return self._noise
+
+    def _set_noise(self, noise):
+        assert noise.dtype == np.float16
+        # Slices handed out by `get()` must never be written to. Use a view,
+        # so the caller's own array stays writeable.
+        if noise.flags.writeable:
+            noise = noise.view()
+            noise.setflags(write=False)
+        self._noise = noise
 
     def get(self, i, dim):
         return self.noise[i : i + dim]
 
+    def get_batch(self, indices, dim):
+        noise = self.noise
+        # Strided (no-copy) view, whose i-th row is `get(i, dim)`; a single
+        # fancy-indexing op then gathers all requested rows at once.
+        rows = np.lib.stride_tricks.as_strided(
+            noise,
+            shape=(len(noise) - dim + 1, dim),
+            strides=(noise.strides[0], noise.strides[0]),
+            writeable=False,
+        )
+        return rows[np.asarray(indices)]
+
     def sample_index(self, dim):
         return np.random.randint(0, len(self.noise) - dim + 1)
 
 
+class LazyNoiseTable:
+    """Noise table, whose slices are generated on demand.
+
+    Each slice is drawn from a Philox (counter-based) PRNG, keyed by the
+    table's seed and with its counter set to the slice's index. This makes
+    `get(i, dim)` deterministic across all workers and the driver without
+    ever materializing (or shipping) the full table.
+    """
+
+    def __init__(self, seed=NOISE_SEED):
+        self.seed = seed
+
+    def get(self, i, dim):
+        gen = np.random.Generator(np.random.Philox(key=self.seed, counter=int(i)))
+        return gen.standard_normal(dim, dtype=np.float32)
+
+    def get_batch(self, indices, dim):
+        batch = np.empty((len(indices), dim), dtype=np.float32)
+        for row, i in zip(batch, indices):
+            gen = np.random.Generator(np.random.Philox(key=self.seed, counter=int(i)))
+            gen.standard_normal(dtype=np.float32, out=row)
+        return batch
+
+    def sample_index(self, dim):
+        return np.random.randint(0, np.iinfo(np.int64).max, dtype=np.int64)
+
+
+def make_noise_table(config, noise):
+    """Returns the noise table to use, given an ES config and the shared noise.
+
+    Args:
+        config: The ES config dict.
+        noise: The shared noise array or its ObjectRef (ignored if
+            `lazy_noise_table` is True).
+    """
+    if config["lazy_noise_table"]:
+        return LazyNoiseTable()
+    return SharedNoiseTable(noise)
+
+
 @ray.remote
 class Worker:
     def __init__(
@@ -214,7 +334,7 @@ class Worker:
         self.config = config
         self.config.update(policy_params)
         self.config["single_threaded"] = True
-        self.noise = SharedNoiseTable(noise)
+        self.noise = make_noise_table(config, noise)
 
         env_context = EnvContext(config["env_config"] or {}, worker_index)
         self.env = env_creator(env_context)
@@ -235,6 +355,13 @@ class Worker:
         self.policy = _policy_class(
             self.env.observation_space, self.env.action_space, config
         )
+        # Cache the number of (flat) weights and use scratch buffers for the
+        # perturbation and the perturbed weights.
+        self._num_params = int(self.policy.num_params)
+        self._perturbation_buf = np.empty(self._num_params, dtype=np.float32)
+        self._theta_buf = np.empty(self._num_params, dtype=np.float32)
+        # Optional sibling actor doing the negatively perturbed rollouts.
+        self._sibling = None
 
     @property
     def filters(self):
@@ -258,20 +385,61 @@ class Worker:
         )
         return rollout_rewards, rollout_fragment_length
 
-    def do_rollouts(self, params, timestep_limit=None):
+    def get_flat_weights(self):
+        return self.policy.get_flat_weights()
+
+    def set_sibling(self, sibling):
+        self._sibling = sibling
+
+    def rollout_signed(self, params, noise_index, sign, timestep_limit=None):
+        """Does one rollout with weights `params + sign * perturbation`."""
+        perturbation = np.multiply(
+            sign * self.config["noise_stdev"],
+            self.noise.get(noise_index, self._num_params),
+            out=self._perturbation_buf,
+            dtype=np.float32,
+        )
+        np.add(params, perturbation, out=self._theta_buf)
+        self.policy.set_flat_weights(self._theta_buf)
+        return self.rollout(timestep_limit)
+
+    def prefetch(self, params):
+        """No-op, used to pull `params` into this worker's node object store.
+
+        Ray resolves `params` (an ObjectRef) before calling this method, so
+        calling it on all workers at once broadcasts the weights in parallel.
+        """
+
+    def do_rollouts(self, params, timestep_limit=None, params_ref=None):
+        """Does rollouts with noise (and some evaluation rollouts w/o noise).
+
+        Args:
+            params: The (resolved) flat weights to perturb.
+            timestep_limit: Optional max. number of timesteps per rollout.
+            params_ref: Optional single-item list holding the ObjectRef of
+                `params` (wrapped, so Ray doesn't resolve it). If given, our
+                sibling (if any) gets `params` through this ref, instead of
+                through a new `ray.put()`.
+        """
         # Set the network weights.
         self.policy.set_flat_weights(params)
+        # Share the weights with our sibling (if any) via the object store.
+        params_id = None
+        if self._sibling is not None:
+            params_id = params_ref[0] if params_ref else ray.put(params)
 
-        noise_indices, returns, sign_returns, lengths = [], [], [], []
+        samples = _AntitheticSamples()
         eval_returns, eval_lengths = [], []
+        eval_flags = _bernoulli_flags(self.config["eval_prob"])
 
         # Perform some rollouts with noise.
         task_tstart = time.time()
         while (
-            len(noise_indices) == 0 or time.time() - task_tstart < self.min_task_runtime
+            samples.num_samples == 0
+            or time.time() - task_tstart < self.min_task_runtime
         ):
 
-            if np.random.uniform() < self.config["eval_prob"]:
+            if next(eval_flags):
                 # Do an evaluation run with no perturbation.
                 self.policy.set_flat_weights(params)
                 rewards, length = self.rollout(timestep_limit, add_noise=False)
@@ -279,27 +447,38 @@ class Worker:
                 eval_lengths.append(length)
             else:
                 # Do a regular run with parameter perturbations.
-                noise_index = self.noise.sample_index(self.policy.num_params)
+                noise_index = self.noise.sample_index(self._num_params)
 
-                perturbation = self.config["noise_stdev"] * self.noise.get(
-                    noise_index, self.policy.num_params
+                perturbation = np.multiply(
+                    self.config["noise_stdev"],
+                    self.noise.get(noise_index, self._num_params),
+                    out=self._perturbation_buf,
+                    dtype=np.float32,
                 )
 
-                # These two sampling steps could be done in parallel on
-                # different actors letting us update twice as frequently.
-                self.policy.set_flat_weights(params + perturbation)
+                # If we have a sibling, it does the negatively perturbed
+                # rollout in parallel to our positively perturbed one.
+                if self._sibling is not None:
+                    neg_id = self._sibling.rollout_signed.remote(
+                        params_id, noise_index, -1, timestep_limit
+                    )
+
+                np.add(params, perturbation, out=self._theta_buf)
+                self.policy.set_flat_weights(self._theta_buf)
                 rewards_pos, lengths_pos = self.rollout(timestep_limit)
 
-                self.policy.set_flat_weights(params - perturbation)
-                rewards_neg, lengths_neg = self.rollout(timestep_limit)
+                if self._sibling is not None:
+                    rewards_neg, lengths_neg = ray.get(neg_id)
+                else:
+                    np.subtract(params, perturbation, out=self._theta_buf)
+                    self.policy.set_flat_weights(self._theta_buf)
+                    rewards_neg, lengths_neg = self.rollout(timestep_limit)
 
-                noise_indices.append(noise_index)
-                returns.append([rewards_pos.sum(), rewards_neg.sum()])
-                sign_returns.append(
-                    [np.sign(rewards_pos).sum(), np.sign(rewards_neg).sum()]
+                samples.record_antithetic(
+                    noise_index, rewards_pos, rewards_neg, lengths_pos, lengths_neg
                 )
-                lengths.append([lengths_pos, lengths_neg])
 
+        noise_indices, returns, sign_returns, lengths = samples.to_numpy()
         return Result(
             noise_indices=noise_indices,
             noisy_returns=returns,
@@ -310,6 +489,63 @@ class Worker:
         )
 
 
+def _bernoulli_flags(p, batch_size=256):
+    """Yields i.i.d. flags, each True with probability p, drawn in batches."""
+    while True:
+        yield from np.random.random(batch_size) < p
+
+
+class _AntitheticSamples:
+    """Per-sample results of a Worker's antithetic rollouts.
+
+    Results are written into preallocated arrays, which are doubled in size
+    whenever they are full.
+    """
+
+    def __init__(self, capacity=16):
+        self.num_samples = 0
+        self.noise_indices = np.empty(capacity, dtype=np.int64)
+        self.returns = np.empty((capacity, 2), dtype=np.float32)
+        self.sign_returns = np.empty((capacity, 2), dtype=np.float32)
+        self.lengths = np.empty((capacity, 2), dtype=np.int64)
+
+    def record_antithetic(
+        self, noise_index, rewards_pos, rewards_neg, length_pos, length_neg
+    ):
+        i = self.num_samples
+        if i == len(self.noise_indices):
+            self._grow()
+        self.noise_indices[i] = noise_index
+        self.returns[i] = rewards_pos.sum(), rewards_neg.sum()
+        # Same as `np.sign(rewards).sum()`, w/o the temporary array.
+        self.sign_returns[i] = (
+            np.count_nonzero(rewards_pos > 0) - np.count_nonzero(rewards_pos < 0),
+            np.count_nonzero(rewards_neg > 0) - np.count_nonzero(rewards_neg < 0),
+        )
+        self.lengths[i] = length_pos, length_neg
+        self.num_samples += 1
+
+    def to_numpy(self):
+        """Returns noise indices, returns, sign returns and lengths (SoA)."""
+        n = self.num_samples
+        return (
+            self.noise_indices[:n],
+            self.returns[:n],
+            self.sign_returns[:n],
+            self.lengths[:n],
+        )
+
+    def _grow(self):
+        for name in ["noise_indices", "returns", "sign_returns", "lengths"]:
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.empty_like(array)]))
+
+
+def _apply_flat_weights(worker, weights):
+    """Sets the given flat weights on all policies of a RolloutWorker."""
+    worker.foreach_policy(lambda p, pid: p.set_flat_weights(weights))
+
+
 def get_policy_class(config):
     if config["framework"] == "torch":
         from ray.rllib.algorithms.es.es_torch_policy import ESTorchPolicy
@@ -348,6 +584,11 @@ class ES(Algorithm):
                 "`evaluation_config.observation_filter` must always be "
                 "`NoFilter` for ES!"
             )
+        if config["update_backend"] not in ["numpy", "jax"]:
+            raise ValueError(
+                "`update_backend` must be one of [numpy|jax] for ES! Got "
+                f"{config['update_backend']}."
+            )
 
     @override(Algorithm)
     def setup(self, config):
@@ -376,19 +617,56 @@ class ES(Algorithm):
             config=self.config,
         )
         self.optimizer = optimizers.Adam(self.policy, self.config["stepsize"])
+        self.jax_backend = None
+        if self.config["update_backend"] == "jax":
+            from ray.rllib.algorithms.es.es_jax_backend import ESJaxBackend
+
+            self.jax_backend = ESJaxBackend(
+                self.policy.num_params,
+                self.config["stepsize"],
+                self.config["l2_coeff"],
+            )
         self.report_length = self.config["report_length"]
 
-        # Create the shared noise table.
-        logger.info("Creating shared noise table.")
-        noise_id = create_shared_noise.remote(self.config["noise_size"])
-        self.noise = SharedNoiseTable(ray.get(noise_id))
+        # Create the shared noise table (only the seed is needed, if lazy).
+        if self.config["lazy_noise_table"]:
+            noise_id = None
+            self.noise = make_noise_table(self.config, None)
+        else:
+            logger.info("Creating shared noise table.")
+            noise_id = create_shared_noise.remote(self.config["noise_size"])
+            self.noise = make_noise_table(self.config, noise_id)
 
         # Create the actors.
         logger.info("Creating actors.")
+        num_workers = self.config["num_workers"]
+        # Spread the actors over all nodes (best effort), so they don't contend
+        # for the same node's CPUs and object store.
+        worker_cls = Worker.options(scheduling_strategy="SPREAD")
         self.workers = [
-            Worker.remote(self.config, {}, self.env_creator, noise_id, idx + 1)
-            for idx in range(self.config["num_workers"])
+            worker_cls.remote(self.config, {}, self.env_creator, noise_id, idx + 1)
+            for idx in range(num_workers)
         ]
+        # Sibling actors, doing the negatively perturbed rollouts for their
+        # respective worker.
+        self._siblings = []
+        if self.config["parallel_antithetic_rollouts"]:
+            self._siblings = [
+                worker_cls.remote(
+                    self.config, {}, self.env_creator, noise_id, num_workers + idx + 1
+                )
+                for idx in range(num_workers)
+            ]
+            ray.get(
+                [
+                    worker.set_sibling.remote(sibling)
+                    for worker, sibling in zip(self.workers, self._siblings)
+                ]
+            )
+
+        # Rollout tasks (mapped to their workers) that are still in flight from
+        # the previous iteration (only if `pipeline_rollouts` is True).
+        self._pending_rollouts = {}
 
         self.episodes_so_far = 0
         self.reward_list = []
@@ -411,8 +689,15 @@ class ES(Algorithm):
         assert theta.dtype == np.float32
         assert len(theta.shape) == 1
 
-        # Put the current policy weights in the object store.
+        # Put the current policy weights in the object store and have all
+        # workers (and their siblings, which get the same `theta_id` passed
+        # through) pull them ahead of their next rollouts. Not waited for:
+        # Actor tasks run in order, so this doesn't cost a blocking round trip
+        # (nor does it wait for rollouts still in flight, see
+        # `pipeline_rollouts`).
         theta_id = ray.put(theta)
+        for worker in self.workers + self._siblings:
+            worker.prefetch.remote(theta_id)
         # Use the actors to do rollouts. Note that we pass in the ID of the
         # policy weights as these are shared.
         results, num_episodes, num_timesteps = self._collect_results(
@@ -422,9 +707,6 @@ class ES(Algorithm):
         self._counters[NUM_AGENT_STEPS_SAMPLED] += num_timesteps
         self._counters[NUM_ENV_STEPS_SAMPLED] += num_timesteps
 
-        all_noise_indices = []
-        all_training_returns = []
-        all_training_lengths = []
         all_eval_returns = []
         all_eval_lengths = []
 
@@ -433,43 +715,42 @@ class ES(Algorithm):
             all_eval_returns += result.eval_returns
             all_eval_lengths += result.eval_lengths
 
-            all_noise_indices += result.noise_indices
-            all_training_returns += result.noisy_returns
-            all_training_lengths += result.noisy_lengths
-
         assert len(all_eval_returns) == len(all_eval_lengths)
-        assert (
-            len(all_noise_indices)
-            == len(all_training_returns)
-            == len(all_training_lengths)
-        )
 
         self.episodes_so_far += num_episodes
 
         # Assemble the results.
         eval_returns = np.array(all_eval_returns)
         eval_lengths = np.array(all_eval_lengths)
-        noise_indices = np.array(all_noise_indices)
-        noisy_returns = np.array(all_training_returns)
-        noisy_lengths = np.array(all_training_lengths)
-
-        # Process the returns.
-        proc_noisy_returns = utils.compute_centered_ranks(noisy_returns)
-
-        # Compute and take a step.
-        g, count = utils.batched_weighted_sum(
-            proc_noisy_returns[:, 0] - proc_noisy_returns[:, 1],
-            (self.noise.get(index, self.policy.num_params) for index in noise_indices),
-            batch_size=500,
-        )
-        g /= noisy_returns.size
-        assert (
-            g.shape == (self.policy.num_params,)
-            and g.dtype == np.float32
-            and count == len(noise_indices)
-        )
-        # Compute the new weights theta.
-        theta, update_ratio = self.optimizer.update(-g + config["l2_coeff"] * theta)
+        noise_indices = np.concatenate([r.noise_indices for r in results])
+        noisy_returns = np.concatenate([r.noisy_returns for r in results])
+        noisy_lengths = np.concatenate([r.noisy_lengths for r in results])
+        assert len(noise_indices) == len(noisy_returns) == len(noisy_lengths)
+
+        if self.jax_backend is not None:
+            theta, g, update_ratio = self.jax_backend.update(
+                theta, self.noise, noise_indices, noisy_returns
+            )
+        else:
+            # Process the returns.
+            proc_noisy_returns = utils.compute_centered_ranks(noisy_returns)
+
+            # Compute and take a step: One (BLAS) matrix-vector product per batch
+            # of noise rows (upcast from the table's float16, if necessary).
+            weights = (proc_noisy_returns[:, 0] - proc_noisy_returns[:, 1]).astype(
+                np.float32
+            )
+            g = np.zeros(self.policy.num_params, dtype=np.float32)
+            for start in range(0, len(noise_indices), 500):
+                batch = slice(start, start + 500)
+                rows = self.noise.get_batch(
+                    noise_indices[batch], self.policy.num_params
+                )
+                g += weights[batch] @ rows.astype(np.float32, copy=False)
+            g /= noisy_returns.size
+            assert g.shape == (self.policy.num_params,) and g.dtype == np.float32
+            # Compute the new weights theta.
+            theta, update_ratio = self.optimizer.update(-g + config["l2_coeff"] * theta)
 
         # Update our train steps counters.
         self._counters[NUM_AGENT_STEPS_TRAINED] += num_timesteps
@@ -481,14 +762,18 @@ class ES(Algorithm):
         if len(all_eval_returns) > 0:
             self.reward_list.append(np.mean(eval_returns))
 
-        # Now sync the filters
-        FilterManager.synchronize(
-            {DEFAULT_POLICY_ID: self.policy.observation_filter}, self.workers
-        )
+        # Now sync the filters (if pipelining, already done with the idle
+        # workers in `_collect_results`; the others are still busy).
+        if not config["pipeline_rollouts"]:
+            FilterManager.synchronize(
+                {DEFAULT_POLICY_ID: self.policy.observation_filter},
+                self.workers + self._siblings,
+            )
 
         info = {
-            "weights_norm": np.square(theta).sum(),
-            "grad_norm": np.square(g).sum(),
+            # Squared norms via (BLAS) dot products, w/o temporary arrays.
+            "weights_norm": float(theta @ theta),
+            "grad_norm": float(g @ g),
             "update_ratio": update_ratio,
             "episodes_this_iter": noisy_lengths.size,
             "episodes_so_far": self.episodes_so_far,
@@ -520,38 +805,89 @@ class ES(Algorithm):
         # Broadcast the new policy weights to all evaluation workers.
         assert worker_set is not None
         logger.info("Synchronizing weights to evaluation workers.")
-        weights = ray.put(self.policy.get_flat_weights())
-        worker_set.foreach_policy(lambda p, pid: p.set_flat_weights(ray.get(weights)))
+        weights = self.policy.get_flat_weights()
+        if worker_set.local_worker() is not None:
+            _apply_flat_weights(worker_set.local_worker(), weights)
+        # Pass the weights' ObjectRef as a top-level arg, such that Ray
+        # resolves it (zero-copy) before calling `_apply_flat_weights`.
+        weights_ref = ray.put(weights)
+        ray.get(
+            [
+                worker.apply.remote(_apply_flat_weights, weights_ref)
+                for worker in worker_set.remote_workers()
+            ]
+        )
 
     @override(Algorithm)
     def cleanup(self):
         # workaround for https://github.com/ray-project/ray/issues/1516
-        for w in self.workers:
+        for w in self.workers + self._siblings:
             w.__ray_terminate__.remote()
 
     def _collect_results(self, theta_id, min_episodes, min_timesteps):
         num_episodes, num_timesteps = 0, 0
         results = []
-        while num_episodes < min_episodes or num_timesteps < min_timesteps:
-            logger.info(
-                "Collected {} episodes {} timesteps so far this iter".format(
-                    num_episodes, num_timesteps
+        # Map each in-flight rollout task to the worker it runs on. Workers
+        # are re-dispatched as soon as their own task returns, so that a
+        # single slow worker doesn't stall all others.
+        pending = self._pending_rollouts
+        self._pending_rollouts = {}
+        busy_workers = list(pending.values())
+        for worker in self.workers:
+            if worker not in busy_workers:
+                # Also pass the (wrapped) ref, for the worker's sibling (if any).
+                rollouts = worker.do_rollouts.remote(theta_id, params_ref=[theta_id])
+                pending[rollouts] = worker
+        while pending:
+            [ready], _ = ray.wait(list(pending), num_returns=1)
+            worker = pending.pop(ready)
+            result = ray.get(ready)
+            results.append(result)
+            # Update the number of episodes and the number of timesteps
+            # keeping in mind that result.noisy_lengths is an array of
+            # shape (num_samples, 2).
+            num_episodes += result.noisy_lengths.size
+            num_timesteps += int(result.noisy_lengths.sum())
+
+            # Not enough yet -> Re-dispatch this worker.
+            if num_episodes < min_episodes or num_timesteps < min_timesteps:
+                logger.debug(
+                    "Collected {} episodes {} timesteps so far this iter".format(
+                        num_episodes, num_timesteps
+                    )
                 )
-            )
-            rollout_ids = [
-                worker.do_rollouts.remote(theta_id) for worker in self.workers
-            ]
-            # Get the results of the rollouts.
-            for result in ray.get(rollout_ids):
-                results.append(result)
-                # Update the number of episodes and the number of timesteps
-                # keeping in mind that result.noisy_lengths is a list of lists,
-                # where the inner lists have length 2.
-                num_episodes += sum(len(pair) for pair in result.noisy_lengths)
-                num_timesteps += sum(sum(pair) for pair in result.noisy_lengths)
+                # Also pass the (wrapped) ref, for the worker's sibling (if any).
+                rollouts = worker.do_rollouts.remote(theta_id, params_ref=[theta_id])
+                pending[rollouts] = worker
+            # Enough: If pipelining, don't wait for the still pending tasks and
+            # re-dispatch all idle workers right away, using all these results
+            # in the next iteration. Otherwise, wait for the pending tasks (they
+            # used the same `theta_id`, so their results are valid, too).
+            elif self.config["pipeline_rollouts"]:
+                self._redispatch_idle_workers(theta_id, pending)
+                break
 
         return results, num_episodes, num_timesteps
 
+    def _redispatch_idle_workers(self, theta_id, pending):
+        busy_workers = list(pending.values())
+        idle = [
+            i for i, worker in enumerate(self.workers) if worker not in busy_workers
+        ]
+        # Sync the filters with the idle workers (and their siblings) only, as
+        # the busy ones would block until their rollouts are done.
+        FilterManager.synchronize(
+            {DEFAULT_POLICY_ID: self.policy.observation_filter},
+            [self.workers[i] for i in idle]
+            + [self._siblings[i] for i in idle if self._siblings],
+        )
+        for i in idle:
+            worker = self.workers[i]
+            # Also pass the (wrapped) ref, for the worker's sibling (if any).
+            rollouts = worker.do_rollouts.remote(theta_id, params_ref=[theta_id])
+            pending[rollouts] = worker
+        self._pending_rollouts = pending
+
     def get_weights(self, policies: Optional[List[PolicyID]] = None) -> dict:
         return self.policy.get_flat_weights()
 
@@ -570,7 +906,8 @@ class ES(Algorithm):
         self.set_weights(state["weights"])
         self.policy.observation_filter = state["filter"]
         FilterManager.synchronize(
-            {DEFAULT_POLICY_ID: self.policy.observation_filter}, self.workers
+            {DEFAULT_POLICY_ID: self.policy.observation_filter},
+            self.workers + self._siblings,
         )
 
 
@@ -0,0 +1,141 @@
+import functools
+import numpy as np
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError:
+    jax = jnp = None
+
+
+def _bucket_size(n):
+    """Returns the smallest power of 2 >= n (to limit jit re-compilations)."""
+    return 1 << max(int(n) - 1, 0).bit_length()
+
+
+def _compute_centered_ranks(x, num_valid):
+    # Same as `utils.compute_centered_ranks`, but centered w.r.t. the number of
+    # valid (non-padding) entries. Padding entries must be +inf, so that they
+    # rank after all valid ones.
+    ranks = jnp.argsort(jnp.argsort(x.ravel())).astype(jnp.float32)
+    return (ranks / (num_valid - 1) - 0.5).reshape(x.shape)
+
+
+def _compute_weights(noisy_returns, num_rows):
+    # Padding rows (beyond `num_rows`) rank last and get a weight of 0.0.
+    valid = jnp.arange(noisy_returns.shape[0]) < num_rows
+    noisy_returns = jnp.where(valid[:, None], noisy_returns, jnp.inf)
+    proc_noisy_returns = _compute_centered_ranks(noisy_returns, 2 * num_rows)
+    return jnp.where(valid, proc_noisy_returns[:, 0] - proc_noisy_returns[:, 1], 0.0)
+
+
+def _accumulate(g, weights, noise):
+    return g + jnp.einsum("n,np->p", weights, noise)
+
+
+def _adam_update(
+    theta, m, v, t, g, num_rows, *, stepsize, l2_coeff, beta1, beta2, epsilon
+):
+    g = g / (2 * num_rows)
+    # Adam step (see `optimizers.Adam`).
+    globalg = -g + l2_coeff * theta
+    a = stepsize * jnp.sqrt(1 - beta2**t) / (1 - beta1**t)
+    m = beta1 * m + (1 - beta1) * globalg
+    v = beta2 * v + (1 - beta2) * (globalg * globalg)
+    step = -a * m / (jnp.sqrt(v) + epsilon)
+    update_ratio = jnp.linalg.norm(step) / jnp.linalg.norm(theta)
+    return theta + step, m, v, g, update_ratio
+
+
+class ESJaxBackend:
+    """Computes the ES gradient and Adam update with jit-compiled functions.
+
+    Mirrors `utils.compute_centered_ranks`, the weighted noise sum done in
+    `ES.step` and `optimizers.Adam`, but keeps the Adam moments on the
+    (default) JAX device and lets XLA fuse each step. Like `ES.step`, the
+    noise is transferred and reduced in batches of (at most) `batch_size`
+    rows. Rollouts are still done by the (tf|torch) policies on the ES
+    workers.
+    """
+
+    def __init__(
+        self,
+        num_params,
+        stepsize,
+        l2_coeff,
+        beta1=0.9,
+        beta2=0.999,
+        epsilon=1e-08,
+        batch_size=500,
+    ):
+        if jax is None:
+            raise ImportError(
+                "Could not import JAX! Install it via `pip install jax` to use "
+                "`update_backend=jax` with ES."
+            )
+        self.num_params = int(num_params)
+        self.batch_size = batch_size
+        self.t = 0
+        self.m = jnp.zeros(self.num_params, dtype=jnp.float32)
+        self.v = jnp.zeros(self.num_params, dtype=jnp.float32)
+        self._compute_weights = jax.jit(_compute_weights)
+        self._accumulate = jax.jit(_accumulate)
+        self._adam_update = jax.jit(
+            functools.partial(
+                _adam_update,
+                stepsize=stepsize,
+                l2_coeff=l2_coeff,
+                beta1=beta1,
+                beta2=beta2,
+                epsilon=epsilon,
+            )
+        )
+
+    def update(self, theta, noise, noise_indices, noisy_returns):
+        """Computes the gradient and returns the updated weights.
+
+        Args:
+            theta: The current flat weights of shape (num_params,).
+            noise: The noise table the perturbations were taken from.
+            noise_indices: The N noise indices used by the workers.
+            noisy_returns: The (N, 2) returns of the positively and negatively
+                perturbed rollouts.
+
+        Returns:
+            Tuple consisting of the new flat weights, the gradient
+            and the update ratio.
+        """
+        self.t += 1
+        num_rows = len(noise_indices)
+        # Pad the returns to a bucketed size, so we don't re-compile for each
+        # new N.
+        returns_block = np.zeros((_bucket_size(num_rows), 2), dtype=np.float32)
+        returns_block[:num_rows] = noisy_returns
+        # Only N floats -> Fetch to host for slicing into the batches below.
+        weights = np.asarray(
+            self._compute_weights(jax.device_put(returns_block), num_rows)
+        )
+
+        # Fixed-size (zero-padded) noise batches -> Only ever compile once.
+        # Note: Each batch is a new host array, as `device_put` may alias (not
+        # copy) host memory on CPU.
+        g = jnp.zeros(self.num_params, dtype=jnp.float32)
+        for start in range(0, num_rows, self.batch_size):
+            end = min(start + self.batch_size, num_rows)
+            batch_weights = np.zeros(self.batch_size, dtype=np.float32)
+            batch_weights[: end - start] = weights[start:end]
+            noise_block = noise.get_batch(
+                noise_indices[start:end], self.num_params
+            ).astype(np.float32, copy=False)
+            if end - start < self.batch_size:
+                noise_block = np.pad(
+                    noise_block, ((0, self.batch_size - (end - start)), (0, 0))
+                )
+            g = self._accumulate(
+                g, jax.device_put(batch_weights), jax.device_put(noise_block)
+            )
+
+        theta, self.m, self.v, g, update_ratio = self._adam_update(
+            jax.device_put(theta), self.m, self.v, np.float32(self.t), g, num_rows
+        )
+        return np.asarray(theta), np.asarray(g), float(update_ratio)
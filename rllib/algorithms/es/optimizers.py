@@ -3,6 +3,38 @@
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _adam_step_numpy(m, v, globalg, a, beta1, beta2, epsilon, step):
+    """Updates the Adam moments `m` and `v` in place and writes the step."""
+    m *= beta1
+    m += (1 - beta1) * globalg
+    v *= beta2
+    v += (1 - beta2) * (globalg * globalg)
+    np.sqrt(v, out=step)
+    step += epsilon
+    np.divide(m, step, out=step)
+    step *= -a
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _adam_step(m, v, globalg, a, beta1, beta2, epsilon, step):
+        """Updates the Adam moments `m` and `v` in place and writes the step."""
+        for i in range(globalg.shape[0]):
+            g = globalg[i]
+            m[i] = beta1 * m[i] + (1 - beta1) * g
+            v[i] = beta2 * v[i] + (1 - beta2) * g * g
+            step[i] = -a * m[i] / (np.sqrt(v[i]) + epsilon)
+
+else:
+    _adam_step = _adam_step_numpy
+
 
 class Optimizer:
     def __init__(self, policy):
@@ -47,7 +79,8 @@ class Adam(Optimizer):
         a = self.stepsize * (
             np.sqrt(1 - self.beta2 ** self.t) / (1 - self.beta1 ** self.t)
         )
-        self.m = self.beta1 * self.m + (1 - self.beta1) * globalg
-        self.v = self.beta2 * self.v + (1 - self.beta2) * (globalg * globalg)
-        step = -a * self.m / (np.sqrt(self.v) + self.epsilon)
+        step = np.empty_like(self.m)
+        _adam_step(
+            self.m, self.v, globalg, a, self.beta1, self.beta2, self.epsilon, step
+        )
         return step
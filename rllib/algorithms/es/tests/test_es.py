@@ -3,13 +3,26 @@ import unittest
 
 import ray
 import ray.rllib.algorithms.es as es
-from ray.rllib.utils.test_utils import check_compute_single_action, framework_iterator
+from ray.rllib.algorithms.es import optimizers, utils
+from ray.rllib.utils.test_utils import (
+    check,
+    check_compute_single_action,
+    framework_iterator,
+)
+
+try:
+    import jax
+except ImportError:
+    jax = None
 
 
 class TestES(unittest.TestCase):
     def setUp(self) -> None:
         ray.init(num_cpus=4)
 
+    def tearDown(self) -> None:
+        ray.shutdown()
+
     def test_es_compilation(self):
         """Test whether an ESAlgorithm can be built on all frameworks."""
         config = es.ESConfig()
@@ -65,6 +78,181 @@ class TestES(unittest.TestCase):
 
             self.assertTrue(np.array_equal(weights, new_weights))
 
+    def test_es_lazy_noise_table(self):
+        """Test whether ES can train with an on-demand generated noise table."""
+        config = es.ESConfig()
+        # Keep it simple.
+        config.training(
+            model={
+                "fcnet_hiddens": [10],
+                "fcnet_activation": None,
+            },
+            lazy_noise_table=True,
+            episodes_per_batch=10,
+            train_batch_size=100,
+        )
+        config.rollouts(num_rollout_workers=1)
+
+        for _ in framework_iterator(config):
+            algo = config.build(env="CartPole-v0")
+            results = algo.train()
+            print(results)
+            algo.stop()
+
+        # The driver's batched rows (gradient) must match the single slices
+        # the workers regenerate independently (perturbations).
+        table = es.es.LazyNoiseTable()
+        indices = [table.sample_index(100) for _ in range(5)]
+        batch = table.get_batch(indices, 100)
+        self.assertEqual(batch.dtype, np.float32)
+        for row, index in zip(batch, indices):
+            self.assertTrue(np.array_equal(row, table.get(index, 100)))
+
+    def test_es_parallel_antithetic_rollouts(self):
+        """Test whether ES can train with sibling actors for the -/+ rollouts."""
+        config = es.ESConfig()
+        # Keep it simple.
+        config.training(
+            model={
+                "fcnet_hiddens": [10],
+                "fcnet_activation": None,
+            },
+            noise_size=2500000,
+            episodes_per_batch=10,
+            train_batch_size=100,
+            parallel_antithetic_rollouts=True,
+        )
+        config.rollouts(num_rollout_workers=1)
+
+        for _ in framework_iterator(config):
+            algo = config.build(env="CartPole-v0")
+            results = algo.train()
+            print(results)
+            self.assertEqual(len(algo._siblings), 1)
+
+            # The sibling's weights must be `theta - perturbation`, with the
+            # same noise slice the paired worker uses for `theta + ...`.
+            sibling = algo._siblings[0]
+            theta = algo.policy.get_flat_weights()
+            num_params = theta.size
+            noise_index = algo.noise.sample_index(num_params)
+            ray.get(sibling.rollout_signed.remote(ray.put(theta), noise_index, -1))
+            expected = theta - algo.config["noise_stdev"] * algo.noise.get(
+                noise_index, num_params
+            ).astype(np.float32)
+            check(ray.get(sibling.get_flat_weights.remote()), expected, decimals=5)
+            algo.stop()
+
+    def test_es_update_kernels(self):
+        """Test the (numba and NumPy) rank and Adam kernels vs their formulas."""
+        # Centered ranks.
+        x = np.random.randn(50, 2)
+        expected = np.empty(x.size)
+        expected[x.ravel().argsort()] = np.arange(x.size)
+        expected = (expected / (x.size - 1) - 0.5).reshape(x.shape)
+        for ranks_fn in [
+            utils._compute_centered_ranks,
+            utils._compute_centered_ranks_numpy,
+        ]:
+            check(ranks_fn(x.ravel()).reshape(x.shape), expected)
+        check(utils.compute_centered_ranks(x), expected)
+
+        # Adam step.
+        a, beta1, beta2, epsilon = 0.01, 0.9, 0.999, 1e-08
+        globalg = np.random.randn(20).astype(np.float32)
+        m0 = np.random.randn(20).astype(np.float32)
+        v0 = np.abs(np.random.randn(20)).astype(np.float32)
+        expected_m = beta1 * m0 + (1 - beta1) * globalg
+        expected_v = beta2 * v0 + (1 - beta2) * (globalg * globalg)
+        expected_step = -a * expected_m / (np.sqrt(expected_v) + epsilon)
+        for adam_fn in [optimizers._adam_step, optimizers._adam_step_numpy]:
+            m, v, step = m0.copy(), v0.copy(), np.empty_like(m0)
+            adam_fn(m, v, globalg, a, beta1, beta2, epsilon, step)
+            check(m, expected_m)
+            check(v, expected_v)
+            check(step, expected_step)
+
+    def test_shared_noise_table_get_batch(self):
+        """Test whether batched (strided) rows match the single slices."""
+        dim = 10
+        table = es.es.SharedNoiseTable(np.random.randn(100).astype(np.float16))
+        # Include the first and the last valid index.
+        indices = [0, 42, 7, 42, len(table.noise) - dim]
+        batch = table.get_batch(indices, dim)
+        self.assertEqual(batch.shape, (len(indices), dim))
+        self.assertTrue(
+            np.array_equal(batch, np.stack([table.get(i, dim) for i in indices]))
+        )
+
+    def test_es_pipeline_rollouts(self):
+        """Test whether idle workers are re-dispatched and leftovers are used."""
+        config = es.ESConfig()
+        # Keep it simple. A single result suffices for an iteration, so the
+        # other worker's rollouts are always left over.
+        config.training(
+            model={
+                "fcnet_hiddens": [10],
+                "fcnet_activation": None,
+            },
+            noise_size=2500000,
+            episodes_per_batch=1,
+            train_batch_size=1,
+            pipeline_rollouts=True,
+        )
+        config.rollouts(num_rollout_workers=2)
+
+        for _ in framework_iterator(config):
+            algo = config.build(env="CartPole-v0")
+            for _ in range(2):
+                leftover = list(algo._pending_rollouts)
+                algo.train()
+                # No worker is left idle: The one that finished first has been
+                # re-dispatched right away, the other one is still busy.
+                busy_workers = list(algo._pending_rollouts.values())
+                self.assertEqual(len(busy_workers), len(algo.workers))
+                self.assertTrue(all(w in busy_workers for w in algo.workers))
+            # Leftover rollouts have been used by the 2nd iteration.
+            self.assertTrue(any(ref not in algo._pending_rollouts for ref in leftover))
+            algo.stop()
+
+    @unittest.skipIf(jax is None, "JAX not installed.")
+    def test_es_jax_backend(self):
+        """Test whether the JAX backend matches ES' NumPy update math."""
+        from ray.rllib.algorithms.es.es_jax_backend import ESJaxBackend
+
+        num_params, num_rows = 20, 11
+        noise = es.es.SharedNoiseTable(np.random.randn(1000).astype(np.float16))
+        noise_indices = np.array(
+            [noise.sample_index(num_params) for _ in range(num_rows)]
+        )
+        noisy_returns = np.random.randn(num_rows, 2).astype(np.float32)
+        theta = np.random.randn(num_params).astype(np.float32)
+
+        # NumPy path (as in `ES.step`).
+        class _Policy:
+            def __init__(self):
+                self.num_params = num_params
+
+            def get_flat_weights(self):
+                return theta
+
+        proc_noisy_returns = utils.compute_centered_ranks(noisy_returns)
+        weights = proc_noisy_returns[:, 0] - proc_noisy_returns[:, 1]
+        g = weights @ noise.get_batch(noise_indices, num_params).astype(np.float32)
+        g /= noisy_returns.size
+        new_theta, update_ratio = optimizers.Adam(_Policy(), 0.01).update(
+            -g + 0.005 * theta
+        )
+
+        # JAX path (with more than one noise batch).
+        backend = ESJaxBackend(num_params, 0.01, 0.005, batch_size=4)
+        jax_theta, jax_g, jax_update_ratio = backend.update(
+            theta, noise, noise_indices, noisy_returns
+        )
+        check(jax_g, g, decimals=5)
+        check(jax_theta, new_theta, decimals=5)
+        check(jax_update_ratio, update_ratio, decimals=5)
+
 
 if __name__ == "__main__":
     import pytest
@@ -3,6 +3,11 @@
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 def compute_ranks(x):
     """Returns ranks in [0, len(x))
@@ -16,13 +21,35 @@ def compute_ranks(x):
     return ranks
 
 
-def compute_centered_ranks(x):
-    y = compute_ranks(x.ravel()).reshape(x.shape).astype(np.float32)
+def _compute_centered_ranks_numpy(x):
+    """Returns the ranks of (1D) x, scaled into [-0.5, 0.5], as float32."""
+    # Single sort, scattering float32 ranks directly (no int -> float copy).
+    y = np.empty(x.size, dtype=np.float32)
+    y[x.argsort()] = np.arange(x.size, dtype=np.float32)
     y /= x.size - 1
     y -= 0.5
     return y
 
 
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _compute_centered_ranks(x):
+        """Returns the ranks of (1D) x, scaled into [-0.5, 0.5], as float32."""
+        y = np.empty(x.shape[0], dtype=np.float32)
+        scale = 1.0 / (x.shape[0] - 1)
+        for rank, i in enumerate(np.argsort(x)):
+            y[i] = rank * scale - 0.5
+        return y
+
+else:
+    _compute_centered_ranks = _compute_centered_ranks_numpy
+
+
+def compute_centered_ranks(x):
+    return _compute_centered_ranks(x.ravel()).reshape(x.shape)
+
+
 def itergroups(items, group_size):
     assert group_size >= 1
     group = []